@@ -6,44 +6,109 @@ Build script for creating Auto Image Logger executable - FIXED VERSION
 import os
 import sys
 import shutil
+# Larger copy buffer for the multi-MB build cache copies (the default was raised
+# upstream too, see gh-117151)
+shutil._COPY_BUFSIZE = 256 * 1024
 import json
-import PyInstaller.__main__
+import argparse
+import compileall
+import hashlib
+import pickle
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+import importlib.util
 import platform
 
+# Platform and --add-data separator (Windows uses ; Linux/Mac uses :)
+_PLATFORM = platform.system()
+_PATH_SEP = ';' if _PLATFORM == 'Windows' else ':'
+
+# Persistent cache kept between builds
+BUILD_CACHE_DIR = ".build_cache"
+
+# PyInstaller work directory and how many cached copies of it to keep
+WORK_DIR = os.path.join("build", "AutoImageLogger")
+MAX_CACHED_BUILDS = 5
+
+# Stdlib modules the logger never uses, left out of the bundle
+EXCLUDED_MODULES = ['tkinter', 'unittest', 'pydoc', 'test', 'distutils', 'lib2to3']
+
+
+def _fast_copy(src, dst):
+    """Hardlink src to dst, falling back to a regular copy (cross-device, existing dst...)."""
+    try:
+        os.link(src, dst)
+    except OSError:
+        # copy2 rather than copyfile: only copy2 goes through CopyFile2 on Windows
+        shutil.copy2(src, dst)
+
 
 def clean_build_dirs():
     """Remove previous build directories."""
+    # BUILD_CACHE_DIR is deliberately kept so package caches survive a clean
     dirs_to_remove = ['build', 'dist', 'auto_image_logger.spec']
     for dir_name in dirs_to_remove:
-        if os.path.exists(dir_name):
+        # Just try the removal instead of stat-ing first
+        try:
             try:
-                if os.path.isdir(dir_name):
-                    shutil.rmtree(dir_name)
-                else:
-                    os.remove(dir_name)
-                print(f"🗑️  Removed: {dir_name}")
-            except Exception as e:
-                print(f"⚠️  Could not remove {dir_name}: {e}")
+                shutil.rmtree(dir_name)
+            except NotADirectoryError:
+                os.unlink(dir_name)
+            print(f"🗑️  Removed: {dir_name}")
+        except FileNotFoundError:
+            continue
+        except Exception as e:
+            print(f"⚠️  Could not remove {dir_name}: {e}")
+
+
+def install_packages(packages):
+    """Install packages with uv if available, falling back to pip."""
+    import subprocess
+    if shutil.which('uv'):
+        cmd = ['uv', 'pip', 'install', '--cache-dir', os.path.join(BUILD_CACHE_DIR, 'uv'),
+               '--python', sys.executable]
+    else:
+        cmd = [sys.executable, "-m", "pip", "install", '--cache-dir', os.path.join(BUILD_CACHE_DIR, 'pip')]
+    subprocess.check_call(cmd + packages)
 
 
 def check_dependencies():
     """Check if required packages are installed."""
-    required_packages = ['pyinstaller', 'requests', 'pillow', 'psutil']
-    missing = []
+    # Package name -> importable module name
+    required_packages = {
+        'pyinstaller': 'PyInstaller',
+        'requests': 'requests',
+        'pillow': 'PIL',
+        'psutil': 'psutil',
+        'mss': 'mss',
+        'numpy': 'numpy',
+    }
+
+    # Skip the check entirely if it already passed for this interpreter
+    cache_key = hashlib.sha256(repr((sys.version, tuple(required_packages))).encode()).hexdigest()
+    sentinel = os.path.join(BUILD_CACHE_DIR, "deps_ok")
+    try:
+        with open(sentinel) as f:
+            if f.read().strip() == cache_key:
+                print("✅ Dependencies already verified")
+                return True
+    except OSError:
+        pass
 
-    for package in required_packages:
-        try:
-            __import__(package.replace('-', '_'))
-        except ImportError:
-            missing.append(package)
+    # find_spec only locates the module, it doesn't run its import code
+    missing = [package for package, module in required_packages.items()
+               if importlib.util.find_spec(module) is None]
 
     if missing:
         print(f"❌ Missing packages: {', '.join(missing)}")
         print("Installing missing packages...")
-        import subprocess
-        subprocess.check_call([sys.executable, "-m", "pip", "install"] + missing)
+        install_packages(missing)
         print("✅ Packages installed")
 
+    os.makedirs(BUILD_CACHE_DIR, exist_ok=True)
+    with open(sentinel, "w") as f:
+        f.write(cache_key)
+
     return True
 
 
@@ -75,12 +140,18 @@ echo.
 pause
 """
 
-    with open("start_logger.bat", "w") as f:
-        f.write(bat_content)
+    # Batch files want CRLF line endings regardless of the build platform
+    Path("start_logger.bat").write_bytes(bat_content.replace("\n", "\r\n").encode('ascii'))
 
     print("✅ Created launcher: start_logger.bat")
 
 
+def write_config_cache(config):
+    """Write auto_config.pkl, a pre-parsed copy of the config tagged with the JSON's mtime."""
+    with open("auto_config.pkl", "wb") as f:
+        pickle.dump((os.path.getmtime("auto_config.json"), config), f, protocol=pickle.HIGHEST_PROTOCOL)
+
+
 def create_config_if_missing():
     """Create default config if it doesn't exist."""
     if not os.path.exists("auto_config.json"):
@@ -109,62 +180,102 @@ def create_config_if_missing():
 
         with open("auto_config.json", "w") as f:
             json.dump(default_config, f, indent=4)
+        write_config_cache(default_config)
 
         print("⚠️  IMPORTANT: Please edit auto_config.json and set your Discord webhook URL!")
         return False
-    return True
-
-
-def build_executable():
-    """Build the executable using PyInstaller."""
-    print("🔨 Building executable...")
-
-    # Get the correct path separator for the current platform
-    # Windows uses ; Linux/Mac uses :
-    path_sep = ";" if platform.system() == "Windows" else ":"
-
-    # PyInstaller arguments - FIXED PATH SEPARATOR
-    args = [
-        'auto_image_logger.py',  # Your main script
-        '--name=AutoImageLogger',  # Output name
-        '--onefile',  # Single executable
-        '--windowed',  # No console window (hidden)
-        '--clean',  # Clean build
-        f'--add-data=auto_config.json{path_sep}.',  # FIXED: Use correct separator
-        '--noconfirm',  # Don't ask for confirmation
-    ]
-
-    # Add icon if exists
-    if os.path.exists("icon.ico"):
-        args.append('--icon=icon.ico')
-
-    # Platform-specific optimizations
-    if platform.system() == "Windows":
-        args.extend([
-            '--uac-admin',  # Request admin privileges if needed
-        ])
 
+    # Refresh the pre-parsed copy if the JSON was edited since it was written
     try:
-        PyInstaller.__main__.run(args)
-        print("✅ Executable built successfully!")
+        with open("auto_config.pkl", "rb") as f:
+            cached_mtime = pickle.load(f)[0]
+    except Exception:
+        cached_mtime = None
+    if cached_mtime != os.path.getmtime("auto_config.json"):
+        with open("auto_config.json") as f:
+            write_config_cache(json.load(f))
+    return True
 
-        # Copy config file to dist folder if it exists
-        if os.path.exists("auto_config.json"):
-            shutil.copy2("auto_config.json", "dist/auto_config.json")
-            print("✅ Copied config to dist folder")
 
-        return True
-    except Exception as e:
-        print(f"❌ Build failed: {e}")
-        print("\n🛠️  Trying alternative build method...")
-        return try_alternative_build()
+def _build_cache_key(args, spec_content=""):
+    """Hash the build inputs (script, config, spec, arguments) into a cache key."""
+    digest = hashlib.sha256()
+    for path in ("auto_image_logger.py", "auto_config.json", "auto_config.pkl"):
+        try:
+            with open(path, "rb") as f:
+                digest.update(f.read())
+        except OSError:
+            pass
+    digest.update(spec_content.encode())
+    digest.update(repr(args).encode())
+    return digest.hexdigest()
+
+
+def restore_build_cache(key):
+    """Seed the PyInstaller work directory from the cache so Analysis can be skipped."""
+    cached = os.path.join(BUILD_CACHE_DIR, "pyinst", key)
+    if not os.path.isdir(cached):
+        return False
+
+    shutil.copytree(cached, WORK_DIR, dirs_exist_ok=True)
+    os.utime(cached)  # Mark as recently used
+    print("♻️  Restored cached build artifacts")
+    return True
 
 
-def try_alternative_build():
-    """Try alternative build method with spec file."""
-    print("🛠️  Creating spec file for manual build...")
+def save_build_cache(key):
+    """Store the PyInstaller work directory in the cache, keeping the most recent entries."""
+    cache_root = os.path.join(BUILD_CACHE_DIR, "pyinst")
+    cached = os.path.join(cache_root, key)
+    try:
+        shutil.rmtree(cached, ignore_errors=True)
+        shutil.copytree(WORK_DIR, cached)
+        os.utime(cached)  # copytree carries over the work dir's mtime
+    except OSError as e:
+        print(f"⚠️  Could not cache build artifacts: {e}")
+        return
+
+    entries = sorted((os.path.join(cache_root, name) for name in os.listdir(cache_root)),
+                     key=os.path.getmtime, reverse=True)
+    for stale in entries[MAX_CACHED_BUILDS:]:
+        shutil.rmtree(stale, ignore_errors=True)
+
+
+def get_dist_dir(onefile=False):
+    """Return the folder PyInstaller places the executable in."""
+    if onefile:
+        return "dist"
+    return os.path.join("dist", "AutoImageLogger")
+
+
+def create_spec_file(onefile=False):
+    """
+    Write auto_image_logger.spec, the single source of truth for build options.
+
+    Returns the spec file content.
+    """
+    if onefile:
+        # Binaries and data go inside the executable, no COLLECT step
+        exe_inputs = """    a.binaries,
+    a.datas,
+    [],"""
+        collect = ""
+    else:
+        exe_inputs = """    [],
+    exclude_binaries=True,"""
+        collect = """
+coll = COLLECT(
+    exe,
+    a.binaries,
+    a.zipfiles,
+    a.datas,
+    strip=(sys.platform != 'win32'),
+    upx=True,
+    upx_exclude=[],
+    name='AutoImageLogger',
+)
+"""
 
-    # Create a spec file
     spec_content = f"""# -*- mode: python ; coding: utf-8 -*-
 import sys
 import os
@@ -177,29 +288,16 @@ a = Analysis(
     ['auto_image_logger.py'],
     pathex=[],
     binaries=[],
-    datas=[('auto_config.json', '.')],
-    hiddenimports=[
-        'requests',
-        'PIL',
-        'PIL._imaging',
-        'PIL._imagingtk',
-        'PIL._imagingft',
-        'psutil',
-        'logging',
-        'json',
-        'datetime',
-        'io',
-        'threading',
-        'signal',
-        'pathlib',
-        'traceback',
-    ],
+    datas=[('auto_config.json', '.'), ('auto_config.pkl', '.')],
+    # Everything else is found from the script's import statements;
+    # _imagingtk is not needed since tkinter is excluded
+    hiddenimports=['PIL._imaging', 'PIL._imagingft'],
     hookspath=[],
     hooksconfig={{}},
     runtime_hooks=[],
-    excludes=[],
+    excludes={EXCLUDED_MODULES!r},
     noarchive=False,
-    optimize=1,
+    optimize=2,
 )
 
 pyz = PYZ(a.pure)
@@ -207,12 +305,11 @@ pyz = PYZ(a.pure)
 exe = EXE(
     pyz,
     a.scripts,
-    [],
-    exclude_binaries=True,
+{exe_inputs}
     name='AutoImageLogger',
     debug=False,
     bootloader_ignore_signals=False,
-    strip=False,
+    strip=(sys.platform != 'win32'),
     upx=True,
     console=False,
     disable_windowed_traceback=False,
@@ -220,57 +317,83 @@ exe = EXE(
     target_arch=None,
     codesign_identity=None,
     entitlements_file=None,
+    uac_admin=(sys.platform == 'win32'),
     icon='icon.ico' if os.path.exists('icon.ico') else None,
 )
+{collect}"""
 
-coll = COLLECT(
-    exe,
-    a.binaries,
-    a.zipfiles,
-    a.datas,
-    strip=False,
-    upx=True,
-    upx_exclude=[],
-    name='AutoImageLogger',
-)
-"""
+    Path("auto_image_logger.spec").write_bytes(spec_content.encode('utf-8'))
+    return spec_content
+
+
+def build_from_spec(fresh=False, onefile=False):
+    """
+    Build the executable with PyInstaller from the generated spec file.
 
-    with open("auto_image_logger.spec", "w") as f:
-        f.write(spec_content)
+    Returns the output folder on success, None on failure.
+    """
+    print("🔨 Building executable...")
 
+    spec_content = create_spec_file(onefile)
     print("📄 Spec file created. Building with spec file...")
 
-    try:
-        PyInstaller.__main__.run(['auto_image_logger.spec', '--clean', '--noconfirm'])
-        print("✅ Executable built successfully from spec file!")
+    spec_args = ['auto_image_logger.spec', '--noconfirm']
 
-        # Copy config file to dist folder
-        if os.path.exists("auto_config.json"):
-            shutil.copy2("auto_config.json", "dist/auto_config.json")
-            print("✅ Copied config to dist folder")
+    # Only wipe PyInstaller's cache when a fresh build was requested
+    if fresh:
+        spec_args.append('--clean')
+
+    cache_key = _build_cache_key(spec_args, spec_content)
+    if not fresh:
+        restore_build_cache(cache_key)
+
+    # Imported here so non-build paths don't pay for loading PyInstaller
+    import PyInstaller.__main__ as _pyi
+
+    # Precompile top-level sources in parallel (asserts and docstrings stripped)
+    compileall.compile_dir('.', maxlevels=0, optimize=2, workers=0, quiet=1)
+
+    try:
+        _pyi.run(spec_args)
+        print("✅ Executable built successfully!")
+        save_build_cache(cache_key)
 
-        return True
+        return get_dist_dir(onefile)
     except Exception as e:
-        print(f"❌ Spec file build also failed: {e}")
-        return False
+        print(f"❌ Build failed: {e}")
+        return None
+
+
+def parse_args():
+    """Parse command line options."""
+    parser = argparse.ArgumentParser(description="Build the Auto Image Logger executable")
+    parser.add_argument('--fresh', '--full', dest='fresh', action='store_true',
+                        help="Remove previous build output and rebuild from scratch")
+    parser.add_argument('--onefile', action='store_true',
+                        help="Build a single self-extracting executable (slower startup)")
+    parser.add_argument('--open', action='store_true',
+                        help="Open the output folder in Explorer after building (Windows, ignored on CI)")
+    return parser.parse_args()
 
 
 def main():
     """Main build function."""
+    args = parse_args()
+
     print("=" * 60)
     print("🔨 AUTO IMAGE LOGGER - EXE BUILDER (FIXED)")
     print("=" * 60)
     print()
 
     # Step 1: Check platform
-    current_platform = platform.system()
-    print(f"🌍 Detected platform: {current_platform}")
+    print(f"🌍 Detected platform: {_PLATFORM}")
     print(f"📁 Current directory: {os.getcwd()}")
     print()
 
-    # Step 2: Clean previous builds
-    print("🧹 Cleaning previous builds...")
-    clean_build_dirs()
+    # Step 2: Clean previous builds (only for fresh builds, keeps PyInstaller's cache otherwise)
+    if args.fresh:
+        print("🧹 Cleaning previous builds...")
+        clean_build_dirs()
 
     # Step 3: Check dependencies
     print("📦 Checking dependencies...")
@@ -282,27 +405,36 @@ def main():
 
     # Step 5: Build executable
     print("🚀 Starting build process...")
-    if build_executable():
-        # Step 6: Create launcher
+    dist_dir = build_from_spec(args.fresh, args.onefile)
+    if dist_dir:
+        # Step 6: Create launcher and copy config to dist (independent, run concurrently)
         print("🚀 Creating launcher script...")
-        create_launcher_bat()
+        tasks = [(create_launcher_bat, ())]
+        if os.path.exists("auto_config.json"):
+            tasks.append((shutil.copy2, ("auto_config.json", os.path.join(dist_dir, "auto_config.json"))))
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            list(executor.map(lambda task: task[0](*task[1]), tasks))
+        if len(tasks) > 1:
+            print("✅ Copied config to dist folder")
 
-        # Step 7: Copy launcher to dist
+        # Step 7: Copy launcher to dist (needs the launcher from step 6)
         if os.path.exists("start_logger.bat"):
-            shutil.copy2("start_logger.bat", "dist/start_logger.bat")
+            _fast_copy("start_logger.bat", os.path.join(dist_dir, "start_logger.bat"))
 
         # Step 8: Show success message
         print("\n" + "=" * 60)
         print("🎉 BUILD SUCCESSFUL!")
         print("=" * 60)
-        print("\n📁 Your files are in the 'dist' folder:")
+        print(f"\n📁 Your files are in the '{dist_dir}' folder:")
         print("   ├── AutoImageLogger.exe  (Main executable)")
+        if dist_dir != "dist":
+            print("   ├── _internal/           (Bundled libraries)")
         print("   ├── start_logger.bat     (Easy launcher)")
         print("   └── auto_config.json     (Configuration)")
         print()
         print("📋 Quick Start:")
-        print("   1. Edit 'dist/auto_config.json' with your Discord webhook URL")
-        print("   2. Run 'dist/start_logger.bat'")
+        print(f"   1. Edit '{dist_dir}/auto_config.json' with your Discord webhook URL")
+        print(f"   2. Run '{dist_dir}/start_logger.bat'")
         print("   3. Check 'auto_logger.log' for output")
         print()
         print("⚠️  IMPORTANT:")
@@ -311,28 +443,25 @@ def main():
         print("   • First run might take a few seconds")
 
         # Open dist folder on Windows
-        if current_platform == "Windows":
-            try:
-                os.startfile("dist")
-            except:
-                pass
+        if args.open and _PLATFORM == "Windows" and not os.environ.get('CI'):
+            os.startfile(dist_dir)
     else:
         print("\n❌ Build failed!")
         print("\n🔧 Manual Build Commands:")
         print("=" * 40)
 
-        if current_platform == "Windows":
+        if _PLATFORM == "Windows":
             print("For Windows Command Prompt:")
             print(
-                'pyinstaller --onefile --windowed --clean --name AutoImageLogger --add-data "auto_config.json;." auto_image_logger.py')
+                'pyinstaller --windowed --clean --name AutoImageLogger --add-data "auto_config.json;." auto_image_logger.py')
             print()
             print("For Windows PowerShell:")
             print(
-                'pyinstaller --onefile --windowed --clean --name AutoImageLogger --add-data "auto_config.json;." auto_image_logger.py')
+                'pyinstaller --windowed --clean --name AutoImageLogger --add-data "auto_config.json;." auto_image_logger.py')
         else:
             print("For Linux/Mac:")
             print(
-                'pyinstaller --onefile --windowed --clean --name AutoImageLogger --add-data "auto_config.json:." auto_image_logger.py')
+                'pyinstaller --windowed --clean --name AutoImageLogger --add-data "auto_config.json:." auto_image_logger.py')
 
 
 if __name__ == "__main__":
